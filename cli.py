@@ -20,7 +20,7 @@ def _create_parser() -> ArgumentParser:
 
     parser = ArgumentParser(
         prog='magicgenerator',
-        description='This is a console utility that can generate random test data in the JSON lines format based on provided data schema.'
+        description='This is a console utility that can generate random test data in the JSON lines, CSV or TSV format based on provided data schema.'
     )
     parser.add_argument(  # output
         '-o',
@@ -34,7 +34,7 @@ def _create_parser() -> ArgumentParser:
         '--count',
         type=int,
         default=int(default_config['count']),
-        help=f'number of json files to generate, default: {int(default_config['count'])}'
+        help=f'number of files to generate, default: {int(default_config['count'])}'
     )
     parser.add_argument(  # filename
         '-f',
@@ -62,13 +62,24 @@ def _create_parser() -> ArgumentParser:
         '--lines',
         type=int,
         default=int(default_config['lines']),
-        help=f'number of lines each json file will contain, default: {int(default_config['lines'])}'
+        help=f'number of lines each file will contain, default: {int(default_config['lines'])}'
+    )
+    parser.add_argument(  # format
+        '--format',
+        choices=['jsonl', 'csv', 'tsv'],
+        default=default_config['format'],
+        help=f'output file format, csv and tsv files start with a header row, tsv follows the PostgreSQL COPY text format, default: {default_config['format']}'
     )
     parser.add_argument(  # clear-path
         '--clear-path',
         action='store_true',
         help='clear the directory of all the files with the same base file name before generating new ones'
     )
+    parser.add_argument(  # verify
+        '--verify',
+        action='store_true',
+        help='verify previously generated files in the output directory against the schema instead of generating new ones'
+    )
     parser.add_argument(  # processes
         '-p',
         '--processes',
@@ -145,6 +156,19 @@ def _parse_arguments(parser: ArgumentParser, args: list[str]) -> Namespace:
         sys.exit(1)
     logging.debug(f'argument -l/--lines: {namespace.lines}')
 
+    # verify
+    if namespace.verify:
+        if namespace.count == 0:
+            logging.error('argument --verify: not allowed with -c/--count 0')
+            sys.exit(1)
+        if namespace.clear_path:
+            logging.error('argument --verify: not allowed with argument --clear-path')
+            sys.exit(1)
+        if namespace.format != 'jsonl':
+            logging.error(f'argument --verify: not allowed with --format {namespace.format}')
+            sys.exit(1)
+    logging.debug(f'argument --verify: {namespace.verify}')
+
     # processes
     if namespace.processes <= 0:
         logging.error(f'argument -p/--processes: invalid positive int value: {namespace.processes}')
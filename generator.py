@@ -6,6 +6,9 @@ import time
 import uuid
 
 
+UUID_PATTERN = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+
+
 class Generator:
 
     def __init__(self):
@@ -14,6 +17,12 @@ class Generator:
     def get(self):
         raise ValueError
 
+    def get_batch(self, count: int) -> list:
+        return [self.get() for _ in range(count)]
+
+    def validate(self, value) -> bool:
+        raise ValueError
+
     def __eq__(self, other):
         same_class = self.__class__.__name__ == other.__class__.__name__
         same_values = self.__dict__ == other.__dict__
@@ -36,6 +45,22 @@ class SchemaGenerator(Generator):
             result[k] = v.get()
         return result
 
+    def get_columns(self, count: int) -> dict[str, list[str | int | float]]:
+        result = dict()
+        for k, v in self.schema.items():
+            result[k] = v.get_batch(count)
+        return result
+
+    def validate(self, value) -> bool:
+        if not isinstance(value, dict):
+            return False
+        if value.keys() != self.schema.keys():
+            return False
+        for k, v in self.schema.items():
+            if not v.validate(value[k]):
+                return False
+        return True
+
 
 class TimestampGenerator(Generator):
 
@@ -45,6 +70,9 @@ class TimestampGenerator(Generator):
     def get(self) -> float:
         return time.time()
 
+    def validate(self, value) -> bool:
+        return isinstance(value, float)
+
 
 class ConstGenerator(Generator):
 
@@ -73,6 +101,12 @@ class ConstGenerator(Generator):
     def get(self) -> str | int:
         return self.value
 
+    def get_batch(self, count: int) -> list[str | int]:
+        return [self.value] * count
+
+    def validate(self, value) -> bool:
+        return type(value) is type(self.value) and value == self.value
+
 
 class RangeGenerator(Generator):
 
@@ -86,6 +120,14 @@ class RangeGenerator(Generator):
     def get(self) -> int:
         return random.randint(self.min, self.max)
 
+    def get_batch(self, count: int) -> list[int]:
+        return random.choices(range(self.min, self.max + 1), k=count)
+
+    def validate(self, value) -> bool:
+        if type(value) is not int:
+            return False
+        return self.min <= value <= self.max
+
 
 class ListGenerator(Generator):
 
@@ -106,6 +148,14 @@ class ListGenerator(Generator):
     def get(self) -> str | int:
         return random.choice(list(self.values))
 
+    def get_batch(self, count: int) -> list[str | int]:
+        return random.choices(list(self.values), k=count)
+
+    def validate(self, value) -> bool:
+        if type(value) not in [str, int]:
+            return False
+        return value in self.values
+
 
 class RandomStrGenerator(Generator):
 
@@ -115,6 +165,11 @@ class RandomStrGenerator(Generator):
     def get(self) -> str:
         return str(uuid.uuid4())
 
+    def validate(self, value) -> bool:
+        if not isinstance(value, str):
+            return False
+        return UUID_PATTERN.fullmatch(value) is not None
+
 
 def _create_str_generator(value: str) -> Generator:
     match value:
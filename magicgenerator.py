@@ -1,13 +1,22 @@
 from argparse import Namespace
 import cli
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import csv
+import generator
 import json
 import logging
 import os
 import random
+import re
+import sys
 import uuid
 
 
+VERIFY_CHUNK_SIZE = 64 * 1024 * 1024
+TSV_NULL = '\\N'
+JSON_DECODER = json.JSONDecoder()
+
+
 def _generate_affixes(type: str, count: int) -> list[str]:
     if count < 1:
         raise ValueError
@@ -32,6 +41,28 @@ def _generate_affixes(type: str, count: int) -> list[str]:
             raise ValueError
 
 
+def _affix_pattern(type: str, count: int) -> str:
+    if count < 1:
+        raise ValueError
+
+    if count == 1:
+        return ''
+
+    match type:
+        case 'count':
+            digits = len(str(count - 1))
+            return rf'\d{{{digits}}}'
+
+        case 'random':
+            return r'[0-9a-f]{32}'
+
+        case 'uuid':
+            return generator.UUID_PATTERN.pattern
+
+        case _:
+            raise ValueError
+
+
 def _list_split(list: list, n: int) -> list[list]:
     sublists = [[] for _ in range(n)]
     for index, item in enumerate(list):
@@ -51,12 +82,59 @@ def _generate_lines(namespace: Namespace, lines: int = None) -> list[str]:
     return [_generate_line(namespace) for _ in range(lines)]
 
 
+def _write_csv(namespace: Namespace, file, lines: int = None) -> None:
+    if lines is None:
+        lines = namespace.lines
+    columns = namespace.generator.get_columns(lines)
+    writer = csv.writer(file, lineterminator='\n', quoting=csv.QUOTE_NOTNULL)
+    writer.writerow(columns.keys())
+    writer.writerows(zip(*columns.values()))
+
+
+def _tsv_escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+def _tsv_column(values: list) -> list[str]:
+    # PostgreSQL COPY text format: \N for NULL, backslash escapes instead of quoting
+    if None not in values:
+        # escape the whole column at once, unless a value contains the separator
+        escaped = _tsv_escape('\x00'.join(map(str, values))).split('\x00')
+        if len(escaped) == len(values):
+            return escaped
+    return [TSV_NULL if value is None else _tsv_escape(str(value)) for value in values]
+
+
+def _write_tsv(namespace: Namespace, file, lines: int = None) -> None:
+    if lines is None:
+        lines = namespace.lines
+    columns = namespace.generator.get_columns(lines)
+    file.write('\t'.join(_tsv_column(list(columns.keys()))) + '\n')
+    rows = zip(*[_tsv_column(values) for values in columns.values()])
+    file.write('\n'.join(map('\t'.join, rows)) + '\n')
+
+
+def _write_delimited(namespace: Namespace, file) -> None:
+    match namespace.format:
+        case 'csv':
+            _write_csv(namespace, file)
+
+        case 'tsv':
+            _write_tsv(namespace, file)
+
+        case _:
+            raise ValueError
+
+
 def _generate_file(namespace: Namespace, affix: str) -> None:
-    filename = namespace.filename + affix + '.jsonl'
+    filename = namespace.filename + affix + '.' + namespace.format
     path = namespace.output + '/' + filename
     try:
-        with open(path, 'w') as file:
-            file.write('\n'.join(_generate_lines(namespace)))
+        with open(path, 'w', newline='') as file:
+            if namespace.format == 'jsonl':
+                file.write('\n'.join(_generate_lines(namespace)))
+            else:
+                _write_delimited(namespace, file)
             logging.info(f'generated file: \"{path}\"')
     except OSError:
         logging.error(f'unable to create file: \"{path}\"')
@@ -78,6 +156,9 @@ def _generate_files_multithreaded(namespace: Namespace, affixes: list[str], thre
 
 
 def _main_stdout(namespace: Namespace) -> None:
+    if namespace.format != 'jsonl':
+        _write_delimited(namespace, sys.stdout)
+        return
     for _ in range(namespace.lines):
         print(_generate_line(namespace))
 
@@ -110,9 +191,133 @@ def _main_generate_files(namespace: Namespace) -> None:
         _generate_file(namespace, '')
 
 
+def _find_files(namespace: Namespace) -> list[str]:
+    affix = _affix_pattern(namespace.affix, namespace.count)
+    pattern = re.compile(re.escape(namespace.filename) + affix + re.escape('.' + namespace.format))
+    paths = []
+    for file in sorted(os.listdir(namespace.output)):
+        path = os.path.join(namespace.output, file)
+        if not os.path.isfile(path):
+            continue
+        if pattern.fullmatch(file) is None:
+            continue
+        paths.append(path)
+    return paths
+
+
+def _split_file(path: str, chunk_size: int = VERIFY_CHUNK_SIZE) -> list[tuple[int, int]]:
+    size = os.path.getsize(path)
+    return [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+
+def _verify_chunk(schema_generator: generator.SchemaGenerator, path: str, start: int, end: int) -> tuple[int, int]:
+    # a chunk owns every line that starts within [start, end)
+    with open(path, 'rb') as file:
+        if start > 0:
+            file.seek(start - 1)
+            file.readline()
+        position = file.tell()
+        if position >= end:
+            return 0, 0
+        data = file.read(end - position)
+        if not data.endswith(b'\n'):
+            data += file.readline()
+
+    try:
+        text = data.decode()
+    except UnicodeDecodeError:
+        lines = data.count(b'\n') + (not data.endswith(b'\n'))
+        return lines, lines
+    if text.endswith('\n'):
+        text = text[:-1]
+
+    lines = 0
+    invalid_lines = 0
+    for line in text.split('\n'):
+        lines += 1
+        try:
+            valid = schema_generator.validate(JSON_DECODER.decode(line))
+        except ValueError:
+            valid = False
+        if not valid:
+            invalid_lines += 1
+    return lines, invalid_lines
+
+
+def _verify_files(namespace: Namespace, paths: list[str]) -> dict[str, tuple[int, int] | None]:
+    # unreadable files map to None
+    results = {path: (0, 0) for path in paths}
+    with ProcessPoolExecutor(max_workers=namespace.processes) as executor:
+        futures = []
+        for path in paths:
+            try:
+                chunks = _split_file(path)
+            except OSError:
+                logging.error(f'unable to read file: \"{path}\"')
+                results[path] = None
+                continue
+            for start, end in chunks:
+                future = executor.submit(_verify_chunk, namespace.generator, path, start, end)
+                futures.append((path, future))
+        for path, future in futures:
+            try:
+                lines, invalid_lines = future.result()
+            except OSError:
+                if results[path] is not None:
+                    logging.error(f'unable to read file: \"{path}\"')
+                results[path] = None
+                continue
+            if results[path] is None:
+                continue
+            total_lines, total_invalid_lines = results[path]
+            results[path] = (total_lines + lines, total_invalid_lines + invalid_lines)
+    return results
+
+
+def _main_verify(namespace: Namespace) -> None:
+    if not os.path.isdir(namespace.output):
+        logging.error(f'unable to verify files, directory not found: \"{namespace.output}\"')
+        sys.exit(1)
+
+    paths = _find_files(namespace)
+    results = _verify_files(namespace, paths)
+
+    failed_files = 0
+    total_lines = 0
+    total_invalid_lines = 0
+    for path, result in results.items():
+        if result is None:
+            failed_files += 1
+            continue
+        lines, invalid_lines = result
+        total_lines += lines
+        total_invalid_lines += invalid_lines
+        if lines != namespace.lines:
+            logging.warning(f'invalid line count in file \"{path}\": {lines}, expected: {namespace.lines}')
+        if invalid_lines > 0:
+            logging.warning(f'{invalid_lines} line(s) not matching the schema in file \"{path}\"')
+        if lines != namespace.lines or invalid_lines > 0:
+            failed_files += 1
+        else:
+            logging.debug(f'verified file: \"{path}\"')
+
+    if len(paths) != namespace.count:
+        logging.warning(f'invalid file count: {len(paths)}, expected: {namespace.count}')
+
+    summary = f'verified {len(paths)} file(s), {total_lines} line(s): {failed_files} invalid file(s), {total_invalid_lines} invalid line(s)'
+    if failed_files > 0 or len(paths) != namespace.count:
+        logging.error(summary)
+        sys.exit(1)
+    logging.info(summary)
+
+
 def main():
     namespace = cli.get_arguments()
 
+    if namespace.verify:
+        _main_verify(namespace)
+        return
+
     match namespace.count:
         case 0:
             _main_stdout(namespace)
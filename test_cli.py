@@ -36,6 +36,16 @@ ARGS = ARG_FILE + ARG_SCHEMA
     (ARGS + ['-l', '0'], False),
     (ARGS + ['-l', '-1000'], False),
 
+    (ARGS + ['--format', 'jsonl'], True),
+    (ARGS + ['--format', 'csv'], True),
+    (ARGS + ['--format', 'tsv'], True),
+    (ARGS + ['--format', 'json'], False),
+
+    (ARGS + ['--verify'], True),
+    (ARGS + ['--verify', '--format', 'csv'], False),
+    (ARGS + ['--verify', '-c', '0'], False),
+    (ARGS + ['--verify', '--clear-path'], False),
+
     (ARGS + ['-p', '-10'], False),
     (ARGS + ['-p', '1'], True),
     (ARGS + ['-p', '999'], True)
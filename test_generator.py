@@ -84,3 +84,66 @@ def test_create_generator(type, value, is_valid, generator_class, generator_args
     else:
         with pytest.raises(ValueError):
             gr.create_generator(type, value)
+
+
+@pytest.mark.parametrize('generator', [
+    gr.ConstGenerator('int', 10),
+    gr.ConstGenerator('str', 'aaa'),
+    gr.RangeGenerator(1, 6),
+    gr.ListGenerator([1, 2, 3]),
+    gr.ListGenerator(['a', 'b', 'c']),
+    gr.RandomStrGenerator()
+])
+def test_get_batch(generator):
+    batch = generator.get_batch(50)
+    assert len(batch) == 50
+    for value in batch:
+        assert generator.validate(value)
+
+
+def test_schema_generator_get_columns():
+    generator = gr.SchemaGenerator({'age': 'int:rand(1, 100)', 'name': 'str:[\'a\', \'b\']'})
+    columns = generator.get_columns(10)
+    assert list(columns.keys()) == ['age', 'name']
+    for values in columns.values():
+        assert len(values) == 10
+    for row in zip(*columns.values()):
+        assert generator.validate(dict(zip(columns.keys(), row)))
+
+
+@pytest.mark.parametrize('generator,value,is_valid', [
+    (gr.TimestampGenerator(), 1633564800.0, True),
+    (gr.TimestampGenerator(), 'aaa', False),
+
+    (gr.ConstGenerator('int'), None, True),
+    (gr.ConstGenerator('int', 10), 10, True),
+    (gr.ConstGenerator('int', 10), 11, False),
+    (gr.ConstGenerator('str', 'aaa'), 'aaa', True),
+    (gr.ConstGenerator('str', 'aaa'), 'bbb', False),
+
+    (gr.RangeGenerator(1, 6), 1, True),
+    (gr.RangeGenerator(1, 6), 6, True),
+    (gr.RangeGenerator(1, 6), 7, False),
+    (gr.RangeGenerator(1, 6), 3.0, False),
+    (gr.RangeGenerator(1, 6), True, False),
+
+    (gr.ListGenerator([1, 2, 3]), 2, True),
+    (gr.ListGenerator([1, 2, 3]), 4, False),
+    (gr.ListGenerator([1, 2, 3]), '2', False),
+    (gr.ListGenerator(['a', 'b', 'c']), 'a', True),
+    (gr.ListGenerator(['a', 'b', 'c']), 'd', False),
+
+    (gr.RandomStrGenerator(), '1b4e28ba-2fa1-4d3b-a3f5-ef19b5a7633b', True),
+    (gr.RandomStrGenerator(), 'aaa', False),
+    (gr.RandomStrGenerator(), '1B4E28BA-2FA1-4D3B-A3F5-EF19B5A7633B', False),
+    (gr.RandomStrGenerator(), '1b4e28ba2fa14d3ba3f5ef19b5a7633b', False),
+    (gr.RandomStrGenerator(), '1b4e28ba-2fa1-4d3b-a3f5-ef19b5a7633b\n', False),
+
+    (gr.SchemaGenerator({'age': 'int:rand(1, 100)'}), {'age': 50}, True),
+    (gr.SchemaGenerator({'age': 'int:rand(1, 100)'}), {'age': 500}, False),
+    (gr.SchemaGenerator({'age': 'int:rand(1, 100)'}), {'name': 50}, False),
+    (gr.SchemaGenerator({'age': 'int:rand(1, 100)'}), {'age': 50, 'name': 'a'}, False),
+    (gr.SchemaGenerator({'age': 'int:rand(1, 100)'}), [50], False)
+])
+def test_validate(generator, value, is_valid):
+    assert generator.validate(value) == is_valid
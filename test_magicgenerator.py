@@ -1,7 +1,10 @@
 from argparse import Namespace
+import csv
+import generator
 import magicgenerator
 import os
 import pytest
+import re
 from unittest.mock import patch
 
 
@@ -21,6 +24,22 @@ def test_generate_affixes(type, count, is_valid):
             magicgenerator._generate_affixes(type, count)
 
 
+@pytest.mark.parametrize('type,count', [
+    ('count', 1),
+    ('count', 10),
+    ('count', 150),
+    ('random', 5),
+    ('uuid', 5)
+])
+def test_affix_pattern(type, count):
+    pattern = re.compile('file' + magicgenerator._affix_pattern(type, count) + r'\.jsonl')
+    affixes = magicgenerator._generate_affixes(type, count) if count > 1 else ['']
+    for affix in affixes:
+        assert pattern.fullmatch(f'file{affix}.jsonl')
+    assert pattern.fullmatch('file_backup.jsonl') is None
+    assert pattern.fullmatch('filename.jsonl') is None
+
+
 @pytest.mark.parametrize('number_list,parts', [
     ([1, 2, 3, 4, 5, 6, 7, 8], 2),
     ([1, 2, 3, 4, 5, 6, 7, 8], 3),
@@ -74,3 +93,126 @@ def test_prepare_dir(example_dir):
     )
     magicgenerator._prepare_dir(namespace)
     assert len(os.listdir(example_dir)) == UNRELATED_FILES
+
+
+@pytest.mark.parametrize('args,is_valid', [
+    (['-c', '3', '-l', '1'], True),
+    (['-c', '3', '-l', '2'], False),
+    (['-c', '4', '-l', '1'], False),
+    (['-c', '3', '-l', '1', '-s', '{\"name\":\"str:[\'Eve\']\"}'], False)
+])
+def test_verify(example_dir, args, is_valid):
+    (example_dir / 'file_backup.jsonl').write_text('aaa')
+    (example_dir / 'file1.jsonl').write_text('{\"name\": \"John\"}')
+    (example_dir / 'file2.jsonl').write_text('{\"name\": \"Adam\"}')
+    (example_dir / 'file3.jsonl').write_text('{\"name\": \"John\"}\n')
+    full_args = [''] + [
+        '-s', str(example_dir / 'schema.json'),
+        '-o', str(example_dir),
+        '--verify'
+    ] + args
+    with patch('sys.argv', full_args):
+        if is_valid:
+            magicgenerator.main()
+        else:
+            with pytest.raises(SystemExit):
+                magicgenerator.main()
+
+
+@pytest.mark.parametrize('chunk_size', [7, 12, 24, 36, 10_000])
+def test_verify_chunk(tmp_path, chunk_size):
+    schema_generator = generator.SchemaGenerator({'age': 'int:rand(1, 50)'})
+    path = tmp_path / 'file.jsonl'
+    # every line is 12 bytes long, so chunk boundaries fall on line starts
+    # for multiples of 12 and inside lines for the other chunk sizes
+    path.write_text('\n'.join(['{\"age\": 10}', '{\"age\": 90}', '{\"age\": 30}'] * 100))
+    lines = 0
+    invalid_lines = 0
+    for start, end in magicgenerator._split_file(str(path), chunk_size):
+        chunk_lines, chunk_invalid_lines = magicgenerator._verify_chunk(schema_generator, str(path), start, end)
+        lines += chunk_lines
+        invalid_lines += chunk_invalid_lines
+    assert lines == 300
+    assert invalid_lines == 100
+
+
+def test_verify_files_unreadable(tmp_path):
+    path = tmp_path / 'file.jsonl'
+    path.write_text('{\"age\": 10}')
+    namespace = Namespace(
+        generator=generator.SchemaGenerator({'age': 'int:rand(1, 50)'}),
+        processes=1
+    )
+    missing = str(tmp_path / 'missing.jsonl')
+    results = magicgenerator._verify_files(namespace, [str(path), missing])
+    assert results == {str(path): (1, 0), missing: None}
+
+
+def test_verify_chunk_undecodable(tmp_path):
+    schema_generator = generator.SchemaGenerator({'age': 'int:rand(1, 50)'})
+    path = tmp_path / 'file.jsonl'
+    path.write_bytes(b'{\"age\": 10}\n{\"age\": \xff}\n{\"age\": 30}')
+    size = path.stat().st_size
+    assert magicgenerator._verify_chunk(schema_generator, str(path), 0, size) == (3, 3)
+
+
+@pytest.mark.parametrize('format,delimiter', [
+    ('csv', ','),
+    ('tsv', '\t')
+])
+def test_generate_file_delimited(tmp_path, format, delimiter):
+    full_args = [''] + [
+        '-s', '{\"age\":\"int:rand(1, 100)\",\"name\":\"str:[\'John\',\'Adam\']\"}',
+        '-o', str(tmp_path),
+        '-l', '20',
+        '--format', format
+    ]
+    with patch('sys.argv', full_args):
+        magicgenerator.main()
+    with open(tmp_path / f'file.{format}', newline='') as file:
+        rows = list(csv.reader(file, delimiter=delimiter))
+    assert rows[0] == ['age', 'name']
+    assert len(rows) == 21
+    for row in rows[1:]:
+        age, name = row
+        assert 1 <= int(age) <= 100
+        assert name in ['John', 'Adam']
+
+
+def test_generate_file_csv_null(tmp_path):
+    full_args = [''] + [
+        '-s', '{\"name\":\"str:\",\"age\":\"int:\"}',
+        '-o', str(tmp_path),
+        '-l', '2',
+        '--format', 'csv'
+    ]
+    with patch('sys.argv', full_args):
+        magicgenerator.main()
+    rows = (tmp_path / 'file.csv').read_text().splitlines()
+    assert rows == ['\"name\",\"age\"', '\"\",', '\"\",']
+
+
+def test_generate_file_tsv_null(tmp_path):
+    full_args = [''] + [
+        '-s', '{\"name\":\"str:\",\"age\":\"int:\",\"tab\":\"str:a\\tb\"}',
+        '-o', str(tmp_path),
+        '-l', '2',
+        '--format', 'tsv'
+    ]
+    with patch('sys.argv', full_args):
+        magicgenerator.main()
+    rows = (tmp_path / 'file.tsv').read_text().splitlines()
+    assert rows == ['name\tage\ttab', '\t\\N\ta\\tb', '\t\\N\ta\\tb']
+
+
+def test_generate_file_tsv_separator(tmp_path):
+    full_args = [''] + [
+        '-s', '{\"a\":\"str:x\\u0000y\",\"b\":\"int:7\"}',
+        '-o', str(tmp_path),
+        '-l', '3',
+        '--format', 'tsv'
+    ]
+    with patch('sys.argv', full_args):
+        magicgenerator.main()
+    rows = (tmp_path / 'file.tsv').read_text().splitlines()
+    assert rows == ['a\tb'] + ['x\x00y\t7'] * 3